@@ -1,8 +1,48 @@
-import json, time, threading, requests
-from flask import Flask, jsonify, request
+import hashlib, json, time, random, threading, requests, urllib3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from flask import Flask, Response, request
 from waitress import serve
 from threading import Event
-import logging
+import atexit, logging, queue, socket
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+	import orjson
+	_loads = orjson.loads
+	_dumps = orjson.dumps
+except ImportError:
+	_loads = json.loads
+	def _dumps(obj):
+		return json.dumps(obj).encode()
+
+def _json_response(payload, status=200):
+	"""
+	Builds a JSON Flask response using the fastest available serializer.
+
+	Args:
+		payload: The JSON-serializable payload.
+		status (int, optional): The HTTP status code. Defaults to 200.
+
+	Returns:
+		Response: Flask JSON response.
+	"""
+	return Response(_dumps(payload), status=status, mimetype='application/json')
+
+NODE_ENDPOINTS = ('status', 'reset', 'stop', 'update', 'sync', 'peers_snapshot', 'wait_for_change')
+# (connect, read) timeouts in seconds for all outbound calls
+HTTP_TIMEOUT = (1.0, 2.0)
+# Worst-case duration of a status ping in seconds: a timed-out connect, its retry and a stalled read
+STATUS_PING_MAX = 2 * HTTP_TIMEOUT[0] + HTTP_TIMEOUT[1]
+# Maximum time in seconds /wait_for_change holds a request open
+LONG_POLL_TIMEOUT = 25
+# Default number of waitress worker threads
+SERVER_THREADS = 4
+# Fixed bounds, because slaves usually learn their slave list after startup. Threads and per-node
+# connection pools are created lazily, so unused capacity costs nothing
+FANOUT_WORKERS = 32
+MAX_PEERS = 128
 
 class Lighthouse: 
 	"""
@@ -12,8 +52,9 @@ class Lighthouse:
 		config_path (str): Path to the configuration JSON file.
 		pass_flask_app (bool, optional): Whether to pass the Flask app to the callback. Defaults to False.
 		interval (int, optional): Monitor thread interval in seconds. Defaults to 5.
+		long_poll (bool, optional): Whether a slave long-polls its parent's /wait_for_change endpoint instead of polling /status. Defaults to False.
 	"""
-	def __init__(self, config_path, pass_flask_app = False, interval = 5):
+	def __init__(self, config_path, pass_flask_app = False, interval = 5, long_poll = False):
 		"""
 		Initializes the Lighthouse node, loads configuration, and sets up logging and callbacks.
 
@@ -21,25 +62,91 @@ class Lighthouse:
 			config_path (str): Path to the configuration JSON file.
 			pass_flask_app (bool, optional): Whether to pass the Flask app to the callback. Defaults to False.
 			interval (int, optional): Monitor thread interval in seconds. Defaults to 5.
+			long_poll (bool, optional): Whether a slave long-polls its parent's /wait_for_change endpoint instead of polling /status. Defaults to False.
 		"""
-		logging.basicConfig(
-			level=logging.INFO,
-			format="%(asctime)s [%(levelname)s] %(message)s",
-		)
+		self._setup_log_queue()
 		self.logger = logging.getLogger("Lighthouse")
 		self.config = self.load_config(config_path)
+		self._self_addr = self.config['self_addr']
+		self._port = self._self_addr.rsplit(':', 1)[1]
+		self._parent_addr = self.config.get('parent_addr')
+		self._status_cond = threading.Condition()
+		self._status_version = 0
+		self._config_lock = threading.Lock()
+		self._set_slaves(self.config['slaves'])
+		self._session = self._build_session()
+		self._status_http = self._build_status_http()
+		self._pool = ThreadPoolExecutor(max_workers=FANOUT_WORKERS)
 		self.pass_flask_app = pass_flask_app
+		self.app = None
 		self.stop_monitor_thread = threading.Event()
+		self._monitor_thread = None
+		self._snapshot_thread = None
+		self._stop_snapshot_thread = threading.Event()
+		self._threads_lock = threading.Lock()
 		self.monitor_interval = interval
+		self._long_poll = long_poll
+		self._parent_version = None
+		self._long_poll_slots = self._build_long_poll_slots(SERVER_THREADS)
+		self._status_body = None
 		self.status = 'waiting'
 		self.custom_status = False
 		self.start_code_callback = None
 		self.stop_code_callback = None
 		self.update_code_callback = None
+		self._stop_cb = None
+		self._update_cb = None
 		self.start_conditions = []
 		self.timeout_start = 0
 		self.timeout = 0
+		self._timeout_timer = None
 		self.last_update = None
+		self._last_update_hash = None
+		self._cluster_snapshot = None
+		self._cluster_snapshot_lock = threading.Lock()
+		self._status_cache = {}
+		self._unreachable = set()
+
+	@property
+	def status(self):
+		"""
+		str: The current status of the node. Setting it invalidates the cached /status body.
+		"""
+		return self._status
+
+	@status.setter
+	def status(self, value):
+		self._status = value
+		self._status_changed()
+
+	def _status_changed(self):
+		"""
+		Invalidates the cached /status body and wakes up pending /wait_for_change requests.
+		"""
+		with self._status_cond:
+			self._status_dirty = True
+			self._status_version += 1
+			self._status_cond.notify_all()
+
+	def _setup_log_queue(self):
+		"""
+		Applies the default logging configuration unless the application already configured logging.
+		The default handler writes to stderr from a background thread through a queue, so the monitor
+		and request threads never block on I/O. Records still propagate to the root logger, so handlers
+		added later by the application keep receiving them.
+		"""
+		if logging.getLogger().handlers:
+			return
+		stream_handler = logging.StreamHandler()
+		stream_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+		log_queue = queue.Queue(-1)
+		listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+		listener.start()
+		atexit.register(listener.stop)
+		queue_handler = QueueHandler(log_queue)
+		# The queue handler only merges the message arguments; the stream handler applies the real format
+		queue_handler.setFormatter(logging.Formatter("%(message)s"))
+		logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
 	def start_callback(self, func):
 		"""
@@ -65,6 +172,7 @@ class Lighthouse:
 			callable: The registered function.
 		"""
 		self.stop_code_callback = func
+		self._stop_cb = self._wrap_optional_arg(func)
 		return func
 	
 	def update_callback(self, func):
@@ -78,39 +186,90 @@ class Lighthouse:
 			callable: The registered function.
 		"""
 		self.update_code_callback = func
+		self._update_cb = self._wrap_optional_arg(func)
 		return func
 
+	@staticmethod
+	def _wrap_optional_arg(func):
+		"""
+		Wraps a callback so it can always be called with one argument, dropping it if the
+		callback takes none. The arity is checked once here instead of on every call.
+
+		Args:
+			func (callable): The callback.
+
+		Returns:
+			callable: A one-argument callable.
+		"""
+		if func.__code__.co_argcount > 0:
+			return func
+		return lambda arg: func()
+
 	def initialize(self):
 		"""
 		Initializes the node based on its role (master or slave), starts monitor thread if needed.
 		"""
 		self.logger.info("Initializing Lighthouse node with role '%s'", self.config.get('role'))
-		if self.config['role'] == 'master' and self.timeout == 0:
-			self.sync_from_slaves()
-			self.notify_slaves("reset")
-			self.start_main_code()
-		elif not hasattr(self, 'monitor_thread') or not self.monitor_thread.is_alive():
-			self.stop_monitor_thread.clear()
-			self.monitor_thread = threading.Thread(target=self.monitor, daemon=True)
-			self.monitor_thread.start()
+		if self.config['role'] == 'master':
+			# While a temporary status is active, its timer reinitializes the master on expiry
+			if self.timeout == 0:
+				self.sync_from_slaves()
+				self.notify_slaves("reset")
+				self.start_main_code()
+		else:
+			self._start_thread('_monitor_thread', self.monitor, stop_attr='stop_monitor_thread')
+
+	def _start_thread(self, attr, target, stop_attr=None):
+		"""
+		Starts a daemon thread stored on the given attribute unless it is already running.
+		Serialized by a lock so concurrent resets cannot start the same thread twice.
+
+		Args:
+			attr (str): Name of the attribute holding the thread.
+			target (callable): The thread's target function.
+			stop_attr (str, optional): Name of the attribute holding the thread's stop event. A thread whose
+				event is set counts as stopped even while it is still exiting; the new thread gets a fresh event.
+		"""
+		with self._threads_lock:
+			thread = getattr(self, attr)
+			stopping = stop_attr is not None and getattr(self, stop_attr).is_set()
+			if thread is not None and thread.is_alive() and not stopping:
+				return
+			if stop_attr is not None:
+				setattr(self, stop_attr, threading.Event())
+			thread = threading.Thread(target=target, daemon=True)
+			setattr(self, attr, thread)
+			thread.start()
 	
 	def sync_from_slaves(self):
 		"""
 		Attempts to synchronize state from slave nodes.
 		"""
-		for ip in self.config['slaves']:
-			if ip == self.config['self_addr']:
-				continue
-			try:
-				resp = requests.get(f'http://{ip}/sync', timeout=2)
-				data = resp.json()
-				if data.get('last_update'):
-					self.logger.info("Synced state from slave %s", ip)
-					if self.update_code_callback:
-						self.update_code_callback(data['last_update'])
-					break
-			except Exception as e:
-				self.logger.error(f"Failed to sync from slave {ip}: {e}")
+		targets = self._peers
+		# Query all slaves at once, but prefer the first one in slave order that has state
+		for ip, last_update in zip(targets, self._pool.map(self._fetch_last_update, targets)):
+			if last_update:
+				self.logger.info("Synced state from slave %s", ip)
+				if self._update_cb:
+					self._update_cb(last_update)
+				break
+
+	def _fetch_last_update(self, ip):
+		"""
+		Fetches the last update stored on a single slave.
+
+		Args:
+			ip (str): The IP address to query.
+
+		Returns:
+			dict or None: The slave's last update, or None if unavailable.
+		"""
+		try:
+			resp = self._session.get(self._url(ip, 'sync'), timeout=HTTP_TIMEOUT)
+			return _loads(resp.content).get('last_update')
+		except Exception as e:
+			self.logger.error("Failed to sync from slave %s: %s", ip, e)
+			return None
 
 	def load_config(self, path):
 		"""
@@ -123,12 +282,99 @@ class Lighthouse:
 			dict: The loaded configuration.
 		"""
 		self.logger.info("Loading config from %s", path)
-		with open(path, 'r') as f:
-			return json.load(f)
+		with open(path, 'rb') as f:
+			return _loads(f.read())
 	
+	def _set_slaves(self, slaves):
+		"""
+		Replaces the known slave list and refreshes the lookup structures derived from it.
+		The config dict is swapped for a new one rather than mutated, so readers holding
+		a reference to the old config never see it change under them.
+
+		Args:
+			slaves (list): List of slave IPs.
+		"""
+		slaves = list(slaves)
+		with self._config_lock:
+			self.config = {**self.config, 'slaves': slaves}
+			self._slaves_set = set(slaves)
+			self._slaves_index = {ip: i for i, ip in enumerate(slaves)}
+			# A slave missing from the list is treated as the second in line
+			self._self_index = self._slaves_index.get(self._self_addr, 1)
+			self._refresh_peers()
+			self._rebuild_urls()
+		self._status_changed()
+
+	def _refresh_peers(self):
+		"""
+		Recomputes the peer tuples used by the fan-out loops from the current slave list.
+		"""
+		slaves = self.config['slaves']
+		self._peers = tuple(ip for ip in slaves if ip != self._self_addr)
+		# Every node this one knows about, in display order: the parent (for slaves, if not listed) followed by the slaves
+		cluster = list(slaves)
+		if self.config['role'] != 'master' and self._parent_addr is not None and self._parent_addr not in self._slaves_set:
+			cluster.insert(0, self._parent_addr)
+		self._cluster = tuple(dict.fromkeys(cluster))
+		self._cluster_peers = tuple(ip for ip in self._cluster if ip != self._self_addr)
+
+	def _rebuild_urls(self):
+		"""
+		Rebuilds the endpoint URLs of all known nodes (slaves and parent).
+		"""
+		ips = list(self.config['slaves'])
+		if self._parent_addr is not None:
+			ips.append(self._parent_addr)
+		self._urls = {ip: {endpoint: f'http://{ip}/{endpoint}' for endpoint in NODE_ENDPOINTS} for ip in ips}
+
+	def _url(self, ip, endpoint):
+		"""
+		Returns the URL of an endpoint on a node, using the prebuilt URL when available.
+
+		Args:
+			ip (str): The node address.
+			endpoint (str): The endpoint name (e.g., 'status').
+
+		Returns:
+			str: The full URL.
+		"""
+		endpoint = endpoint.lstrip("/")
+		try:
+			return self._urls[ip][endpoint]
+		except KeyError:
+			return f'http://{ip}/{endpoint}'
+
+	def _build_session(self):
+		"""
+		Builds the shared HTTP session used for all outbound calls to other nodes.
+
+		Returns:
+			requests.Session: The configured session.
+		"""
+		# POSTs are only retried when the connection could not be made; once sent, /update or /reset
+		# may already be running on the peer, and a resend would run it twice
+		retries = Retry(total=2, connect=2, read=1, other=0, backoff_factor=0.2, status_forcelist=(502, 503, 504), allowed_methods=frozenset(['GET']))
+		adapter = HTTPAdapter(pool_connections=MAX_PEERS, pool_maxsize=8, max_retries=retries)
+		session = requests.Session()
+		session.mount('http://', adapter)
+		session.headers.update({'Connection': 'keep-alive'})
+		return session
+
+	def _build_status_http(self):
+		"""
+		Builds the urllib3 pool used for /status pings, the most frequent outbound call,
+		skipping the per-request overhead of requests.
+
+		Returns:
+			urllib3.PoolManager: The configured pool manager.
+		"""
+		# A single connect retry only: a ping must finish well within one election step
+		retries = Retry(total=1, connect=1, read=0, backoff_factor=0.2)
+		return urllib3.PoolManager(num_pools=MAX_PEERS, maxsize=4, retries=retries, timeout=urllib3.Timeout(connect=HTTP_TIMEOUT[0], read=HTTP_TIMEOUT[1]))
+
 	def register_routes(self):
 		"""
-		Registers Flask routes for status, reset, stop, update, and sync endpoints.
+		Registers Flask routes for status, reset, stop, update, sync, peers_snapshot, and wait_for_change endpoints.
 		"""
 		self.logger.info("Registering Flask routes")
 		self.app.add_url_rule("/status", "status", self.get_status, methods=["GET"])
@@ -136,6 +382,8 @@ class Lighthouse:
 		self.app.add_url_rule("/stop", "stop", self.stop, methods=["POST"])
 		self.app.add_url_rule("/update", "update", self.update, methods=["POST"])
 		self.app.add_url_rule("/sync", "sync", self.sync, methods=["GET"])
+		self.app.add_url_rule("/peers_snapshot", "peers_snapshot", self.peers_snapshot, methods=["GET"])
+		self.app.add_url_rule("/wait_for_change", "wait_for_change", self.wait_for_change, methods=["GET"])
 
 	def set_temp_status(self, status_msg = "stopped temporarily", timeout = 60):
 		"""
@@ -150,8 +398,27 @@ class Lighthouse:
 		self.status = status_msg
 		self.timeout_start = time.time()
 		self.timeout = timeout
+		if self._timeout_timer is not None:
+			self._timeout_timer.cancel()
+		self._timeout_timer = threading.Timer(timeout, self._expire_temp_status)
+		self._timeout_timer.daemon = True
+		self._timeout_timer.start()
 		self.stop_main_code("stop")
 
+	def _expire_temp_status(self):
+		"""
+		Clears the temporary status once its timeout has elapsed. A master is reinitialized,
+		a slave goes back to waiting and keeps monitoring its parent. A slave that promoted
+		itself in the meantime keeps running.
+		"""
+		self.logger.info("Timeout reached, reinitializing")
+		self.custom_status = False
+		self.timeout = 0
+		if self.config['role'] == 'master':
+			self.initialize()
+		elif self.status != 'running':
+			self.status = 'waiting'
+
 	def get_status(self):
 		"""
 		Returns the current status of the node as a JSON response.
@@ -160,11 +427,60 @@ class Lighthouse:
 			Response: Flask JSON response with name, status, and slaves.
 		"""
 		self.logger.debug("Status requested")
-		return jsonify({
+		if self._status_dirty or self._status_body is None:
+			# Clear the flag first so a change made while serializing marks the body dirty again
+			self._status_dirty = False
+			self._status_body = _dumps(self._status_payload())
+		return Response(self._status_body, mimetype='application/json')
+
+	def _status_payload(self):
+		"""
+		Builds the status payload served by /status and /wait_for_change.
+
+		Returns:
+			dict: Dict with name, status, and slaves.
+		"""
+		return {
 			'name': self.config['name'] if 'name' in self.config else 'Server',
 			'status': self.status,
 			'slaves': self.config['slaves']
-		})
+		}
+
+	def wait_for_change(self):
+		"""
+		Handles the /wait_for_change endpoint. Blocks until the node's status version differs from the
+		`since` query parameter or LONG_POLL_TIMEOUT elapses, then returns the status payload.
+		When all long-poll slots are taken, the payload is returned immediately instead.
+
+		Returns:
+			Response: Flask JSON response with name, status, slaves, and version.
+		"""
+		since = request.args.get('since', type=int)
+		slots = self._long_poll_slots
+		# Waiters must never take every worker thread, or /status stops answering and children fail over
+		waiting = slots is None or slots.acquire(blocking=False)
+		try:
+			with self._status_cond:
+				if waiting:
+					self._status_cond.wait_for(lambda: self._status_version != since, timeout=LONG_POLL_TIMEOUT)
+				version = self._status_version
+		finally:
+			if waiting and slots is not None:
+				slots.release()
+		return _json_response(dict(self._status_payload(), version=version))
+
+	@staticmethod
+	def _build_long_poll_slots(threads):
+		"""
+		Builds the semaphore limiting concurrent /wait_for_change waiters to half of the server's worker threads.
+
+		Args:
+			threads (int): Number of server worker threads.
+
+		Returns:
+			threading.BoundedSemaphore: The semaphore.
+		"""
+		return threading.BoundedSemaphore(threads // 2)
 
 	def reset(self):
 		"""
@@ -197,23 +513,44 @@ class Lighthouse:
 			Response: Flask JSON response with last_update.
 		"""
 		self.logger.debug("Sync endpoint called")
-		return jsonify({'last_update': self.last_update}), 200
+		return _json_response({'last_update': self.last_update})
+
+	def peers_snapshot(self):
+		"""
+		Handles the /peers_snapshot endpoint. Returns this node's cached view of the cluster.
+		Never polls other nodes: until the first snapshot exists, only this node is listed.
+
+		Returns:
+			Response: Flask JSON response mapping each node's IP to its name and status.
+		"""
+		self.logger.debug("Peers snapshot endpoint called")
+		peers = {entry['ip']: {'name': entry['name'], 'status': entry['status']} for entry in self._cached_cluster_snapshot() or []}
+		peers[self._self_addr] = {'name': self.config.get('name', 'Server'), 'status': self.status}
+		return _json_response(peers)
 
 	def update(self):
 		"""
 		Handles the /update endpoint. Updates the node's state with provided data.
+		A body identical to the last applied update is ignored.
 
 		Returns:
 			Response: Empty response with status 204.
 		"""
-		self.logger.info("Update endpoint called")
-		data = request.get_json()
+		self.logger.debug("Update endpoint called")
+		body = request.get_data()
+		digest = hashlib.blake2b(body, digest_size=16).digest()
+		if digest == self._last_update_hash:
+			self.logger.debug("Ignoring duplicate update")
+			return '', 204
+		try:
+			data = _loads(body)
+		except ValueError:
+			self.logger.warning("Ignoring update with invalid JSON body")
+			return '', 400
 		self.last_update = data
-		if hasattr(self, 'update_code_callback') and self.update_code_callback:
-			if self.update_code_callback.__code__.co_argcount > 0:
-				self.update_code_callback(data)
-			else:
-				self.update_code_callback()
+		if self._update_cb:
+			self._update_cb(data)
+		self._last_update_hash = digest
 		return '', 204
 
 	def send_update(self, data):
@@ -224,46 +561,35 @@ class Lighthouse:
 			data (dict): The update data to send.
 		"""
 		self.logger.info("Sending update to all slaves")
-		for ip in self.config['slaves']:
-			if ip == self.config['self_addr']:
-				continue
-			try:
-				requests.post(f'http://{ip}/update', json=data, timeout=2)
-				self.logger.info("Sent update to %s", ip)
-			except Exception as e:
-				self.logger.error(f'Failed to send update to {ip}: {e}')
+		self._broadcast(self._peers, 'update', json=data)
 	
 	def monitor(self):
 		"""
 		Monitor thread for failover and status checking. Promotes to active if needed.
 		"""
 		self.logger.info("Monitor thread started")
-		while not self.stop_monitor_thread.is_set():
+		# Keep the event this thread was started with; a restart replaces the attribute
+		stop_event = self.stop_monitor_thread
+		while not stop_event.is_set():
+			parent_status = None
+			parent_version = self._parent_version
 			try:
-				if self.timeout != 0 and self.timeout_start+self.timeout < time.time():
-					self.logger.info("Timeout reached, reinitializing")
-					self.stop_monitor_thread.set()
-					self.custom_status = False
-					self.timeout = 0
-					self.initialize()
-					break
-				elif self.config['role'] == "slave":
-					parent_status = self.ping_raw_status(self.config['parent_addr'])
-					if not self.config['slaves']:
-						slaves = self.get_slaves(self.config['parent_addr'])
-						if slaves:
-							self.config['slaves'] = slaves
+				if self.config['role'] == "slave":
+					parent_status, parent_slaves = self._fetch_parent_state(wait=self._long_poll)
+					if not self.config['slaves'] and parent_slaves:
+						self._set_slaves(parent_slaves)
 					if parent_status not in ['running', "waiting"]:
 						if not self.status == 'running':
 							self.logger.warning('Parent down. Checking failover...')
-							try:
-								sleep_time = 5 * self.config['slaves'].index(self.config['self_addr'])
-							except ValueError:
-								sleep_time = 5
-							time.sleep(sleep_time)
+							if stop_event.wait(self._election_delay()):
+								break
 							if not self.any_main_running():
-								self.logger.info("Promoting to active")
-								self.promote_to_active()
+								# any_main_running just pinged the parent afresh, so this re-check is served from the cache
+								if self.ping_raw_status(self._parent_addr) in ['running', "waiting"]:
+									self.logger.info("Parent is back. Skipping failover.")
+								else:
+									self.logger.info("Promoting to active")
+									self.promote_to_active()
 					elif parent_status == 'running':
 						if self.status == 'running':
 							self.logger.info("Parent is running. Stopping main code.")
@@ -271,45 +597,126 @@ class Lighthouse:
 			except Exception as e:
 				self.logger.error('Error in monitor: %s', e)
 			
-			time.sleep(self.monitor_interval)
+			# A long poll that returned a change is renewed at once; after a timeout, a busy parent or a failure, wait the interval
+			long_polled = self._long_poll and parent_status is not None and self._parent_version != parent_version
+			if stop_event.wait(0 if long_polled else self.monitor_interval):
+				break
 
-	def ping_status(self, ip):
+	def _election_delay(self):
+		"""
+		Computes how long this slave waits before trying to take over from a failed parent.
+		Slaves earlier in the slave list wait less and therefore win. Each step is longer than the
+		jitter plus a worst-case status ping, so a slave that promotes itself is already running
+		when the next one in line checks. Past 30 seconds the jitter is dropped and the steps shrink
+		to a worst-case status ping plus a margin, so distant slaves wait less but keep their order.
+
+		Returns:
+			float: Delay in seconds.
+		"""
+		step = STATUS_PING_MAX + 1.5
+		capped_index = int(30 // step)
+		if self._self_index <= capped_index:
+			return step * self._self_index + random.uniform(0, 1)
+		return step * capped_index + 1 + (self._self_index - capped_index) * (STATUS_PING_MAX + 0.5)
+
+	def _fetch_status(self, ip, max_age=1.0):
+		"""
+		Fetches the /status payload of a node. Results (and failures) are cached per IP for max_age seconds,
+		so the monitor and cluster snapshot share a single request per node.
+
+		Args:
+			ip (str): The IP address to query.
+			max_age (float, optional): Maximum age of a cached result in seconds. Defaults to 1.0.
+
+		Returns:
+			dict: The decoded status payload.
+
+		Raises:
+			Exception: If the node could not be reached or returned invalid data.
+		"""
+		now = time.monotonic()
+		cached = self._status_cache.get(ip)
+		if cached is not None and now - cached[0] < max_age:
+			result = cached[1]
+		else:
+			try:
+				res = self._status_http.request('GET', self._url(ip, 'status'))
+				result = _loads(res.data)
+			except Exception as e:
+				result = e
+				self._peer_unreachable(ip, e)
+			else:
+				self._peer_reachable(ip)
+			# A slow request must not replace the result of one that started later
+			cached = self._status_cache.get(ip)
+			if cached is None or cached[0] <= now:
+				self._status_cache[ip] = (now, result)
+		if isinstance(result, Exception):
+			raise result
+		return result
+
+	def _peer_unreachable(self, ip, error):
+		"""
+		Logs a failed call to a node: a warning the first time, then debug messages while it stays unreachable.
+
+		Args:
+			ip (str): The node address.
+			error (Exception): The error raised by the call.
+		"""
+		if ip in self._unreachable:
+			self.logger.debug("%s is still unreachable: %s", ip, error)
+		else:
+			self._unreachable.add(ip)
+			self.logger.warning("%s is unreachable: %s", ip, error)
+
+	def _peer_reachable(self, ip):
+		"""
+		Logs that a node reported as unreachable answers again.
+
+		Args:
+			ip (str): The node address.
+		"""
+		if ip in self._unreachable:
+			self._unreachable.discard(ip)
+			self.logger.info("%s is reachable again", ip)
+
+	def ping_status(self, ip, max_age=1.0):
 		"""
 		Pings a node for its status.
 
 		Args:
 			ip (str): The IP address to ping.
+			max_age (float, optional): Maximum age of a cached result in seconds; 0 always pings. Defaults to 1.0.
 
 		Returns:
 			str: 'UP', 'IDLE', or 'DOWN' depending on the node's status.
 		"""
 		try:
-			res = requests.get(f'http://{ip}/status', timeout=2)
-			data = res.json()
+			data = self._fetch_status(ip, max_age)
 			if data['status'] == 'running':
 				return 'UP'
 			else:
 				return 'IDLE'
 		except Exception:
-			self.logger.warning("Failed to ping status of %s", ip)
+			self.logger.debug("Failed to ping status of %s", ip)
 			return 'DOWN'
 
-	def ping_raw_status(self, ip):
+	def ping_raw_status(self, ip, max_age=1.0):
 		"""
 		Pings a node and returns its raw status string.
 
 		Args:
 			ip (str): The IP address to ping.
+			max_age (float, optional): Maximum age of a cached result in seconds; 0 always pings. Defaults to 1.0.
 
 		Returns:
 			str or None: The status string or None if failed.
 		"""
 		try:
-			res = requests.get(f'http://{ip}/status', timeout=2)
-			data = res.json()
+			data = self._fetch_status(ip, max_age)
 			return data['status']
 		except Exception:
-			self.logger.warning("Failed to ping raw status of %s", ip)
+			self.logger.debug("Failed to ping raw status of %s", ip)
 			return None
 
 	def get_slaves(self, ip):
@@ -323,28 +730,82 @@ class Lighthouse:
 			list: List of slave IPs.
 		"""
 		try:
-			res = requests.get(f'http://{ip}/status', timeout=2)
-			data = res.json()
-			ip_list = data['slaves'] if self.config['parent_addr'] in data['slaves'] else [self.config['parent_addr']] + data['slaves']
-			return ip_list
+			data = self._fetch_status(ip)
+			return self._with_parent(data['slaves'])
 		except Exception:
-			self.logger.warning("Failed to get slaves from %s", ip)
+			self.logger.debug("Failed to get slaves from %s", ip)
 			return []
 
+	def _with_parent(self, slaves):
+		"""
+		Prepends the parent address to a slave list unless it is already part of it.
+
+		Args:
+			slaves (list): List of slave IPs.
+
+		Returns:
+			list: List of slave IPs including the parent.
+		"""
+		return slaves if self._parent_addr in slaves else [self._parent_addr] + slaves
+
+	def _fetch_parent_state(self, wait=False):
+		"""
+		Fetches the parent's status and slave list with a single request.
+
+		Args:
+			wait (bool, optional): Whether to long-poll the parent's /wait_for_change endpoint,
+				returning once its status changes. Falls back to /status if the parent does not support it. Defaults to False.
+
+		Returns:
+			tuple: The status string (None if unreachable) and the list of slave IPs (empty if unreachable).
+		"""
+		try:
+			data = self._wait_for_parent_change() if wait else None
+			if data is None:
+				data = self._fetch_status(self._parent_addr)
+			else:
+				self._peer_reachable(self._parent_addr)
+			return data['status'], self._with_parent(data['slaves'])
+		except Exception as e:
+			self._peer_unreachable(self._parent_addr, e)
+			return None, []
+
+	def _wait_for_parent_change(self):
+		"""
+		Long-polls the parent's /wait_for_change endpoint with the last status version seen.
+
+		Returns:
+			dict or None: The parent's status payload, or None if the parent does not support long-polling.
+		"""
+		fields = {} if self._parent_version is None else {'since': self._parent_version}
+		# No retries: a parent that stops answering must be noticed after one read timeout, not two
+		res = self._status_http.request('GET', self._url(self._parent_addr, 'wait_for_change'), fields=fields, retries=False,
+			timeout=urllib3.Timeout(connect=HTTP_TIMEOUT[0], read=LONG_POLL_TIMEOUT + HTTP_TIMEOUT[1]))
+		if res.status == 404:
+			self.logger.warning("Parent %s does not support long-polling, falling back to polling", self._parent_addr)
+			self._long_poll = False
+			return None
+		data = _loads(res.data)
+		self._parent_version = data['version']
+		return data
+
 	def any_main_running(self):
 		"""
-		Checks if any main node is running among the slaves or parent.
+		Checks if any main node is running among the slaves or parent. Used for failover decisions,
+		so every node is pinged afresh instead of being served from the status cache.
 
 		Returns:
 			bool: True if any node is running, False otherwise.
 		"""
-		ip_list = self.config['slaves'] if self.config['role'] == 'master' or ('parent_addr' in self.config and self.config['parent_addr'] in self.config['slaves']) else [self.config['parent_addr']] + self.config['slaves']
-		for ip in ip_list:
-			if ip == self.config['self_addr']:
-				continue
-			if self.ping_status(ip) == 'UP':
-				return True
-		return False
+		futures = [self._pool.submit(self.ping_status, ip, 0) for ip in self._cluster_peers]
+		try:
+			for future in as_completed(futures):
+				if future.result() == 'UP':
+					return True
+			return False
+		finally:
+			for future in futures:
+				future.cancel()
 
 	def promote_to_active(self):
 		"""
@@ -363,24 +824,11 @@ class Lighthouse:
 		"""
 		self.logger.info("Notifying lower nodes at endpoint /%s", endpoint.lstrip("/"))
 		if self.config['role'] == 'master':
-			for ip in self.config['slaves']:
-				if ip == self.config['self_addr']:
-					continue
-				try:
-					requests.post(f'http://{ip}/{endpoint.lstrip("/")}', timeout=2)
-					self.logger.info("Notified %s", ip)
-				except Exception:
-					self.logger.error(f'Failed to notify {ip}')
+			ip_list = self.config['slaves']
 		else:
-			index = self.config['slaves'].index(self.config['self_addr'])
-			for ip in self.config['slaves'][index+1:]:
-				if ip == self.config['self_addr']:
-					continue
-				try:
-					requests.post(f'http://{ip}/{endpoint.lstrip("/")}', timeout=2)
-					self.logger.info("Notified %s", ip)
-				except Exception:
-					self.logger.error(f'Failed to notify {ip}')
+			ip_list = self.config['slaves'][self._self_index+1:]
+		targets = [ip for ip in ip_list if ip != self._self_addr]
+		self._broadcast(targets, endpoint, wait=False)
 
 	def notify_slaves(self, endpoint):
 		"""
@@ -390,14 +838,42 @@ class Lighthouse:
 			endpoint (str): The endpoint to notify (e.g., 'reset').
 		"""
 		self.logger.info("Notifying slaves at endpoint /%s", endpoint.lstrip("/"))
-		for ip in self.config['slaves']:
-			if ip == self.config['self_addr']:
-				continue
-			try:
-				requests.post(f'http://{ip}/{endpoint.lstrip("/")}', timeout=2)
-				self.logger.info("Notified %s", ip)
-			except Exception:
-				self.logger.error(f'Failed to notify {ip}')
+		self._broadcast(self._peers, endpoint, wait=False)
+
+	def _broadcast(self, targets, endpoint, wait=True, **kwargs):
+		"""
+		POSTs to an endpoint on several nodes in parallel.
+
+		Args:
+			targets (list): The IP addresses to post to.
+			endpoint (str): The endpoint to post to (e.g., 'reset').
+			wait (bool, optional): Whether to wait for all posts to finish. Defaults to True.
+			**kwargs: Extra arguments passed to the POST request (e.g., json).
+		"""
+		futures = [self._pool.submit(self._post_nothrow, ip, endpoint, **kwargs) for ip in targets]
+		if wait:
+			for future in futures:
+				future.result()
+
+	def _post_nothrow(self, ip, endpoint, **kwargs):
+		"""
+		POSTs to an endpoint on a single node, logging instead of raising on failure.
+
+		Args:
+			ip (str): The IP address to post to.
+			endpoint (str): The endpoint to post to (e.g., 'reset').
+			**kwargs: Extra arguments passed to the POST request (e.g., json).
+
+		Returns:
+			bool: True if the request was sent, False otherwise.
+		"""
+		try:
+			self._session.post(self._url(ip, endpoint), timeout=HTTP_TIMEOUT, **kwargs)
+			self.logger.debug("Notified %s at /%s", ip, endpoint.lstrip("/"))
+			return True
+		except Exception as e:
+			self.logger.error("Failed to notify %s at /%s: %s", ip, endpoint.lstrip("/"), e)
+			return False
 
 	def start_main_code(self):
 		"""
@@ -407,51 +883,107 @@ class Lighthouse:
 		self.status = 'running'
 		if self.start_code_callback:
 			if self.pass_flask_app:
-				if not hasattr(self, 'app') or self.app is None:
+				if self.app is None:
 					self.app = Flask(__name__)
-				port = self.config['self_addr'].rsplit(':', 1)[1]
-				self.start_code_callback(self.app, port)
+				self.start_code_callback(self.app, self._port)
 			else:
 				self.start_code_callback()
 
 	def get_all_statuses(self):
 		"""
 		Gets the status of all nodes (self, slaves, and parent if applicable).
+		Peer statuses come from the cluster snapshot, which the first call takes directly and a background
+		thread then refreshes every monitor interval; this node's own status is always current.
 
 		Returns:
 			list: List of dicts with name, ip, and status for each node.
 		"""
-		self.logger.info("Getting all statuses")
-		res = []
-		seen_ips = set()
-		ip_list = self.config['slaves']
-		# If not master, parent may be included
-		if self.config['role'] != 'master' and 'parent_addr' in self.config and self.config['parent_addr'] not in ip_list:
-			ip_list = [self.config['parent_addr']] + ip_list
-
-		# Build statuses in the order of ip_list
-		for ip in ip_list:
-			if ip in seen_ips:
-				continue
-			if ip == self.config['self_addr']:
-				# Add self status
-				res.append({'name': self.config.get('name', 'Server'), 'ip': ip, 'status': self.status})
-				seen_ips.add(ip)
-				continue
+		snapshot = self._cached_cluster_snapshot()
+		if snapshot is None:
+			snapshot = self._refresh_cluster_snapshot()
+		return [dict(entry, status=self.status) if entry['ip'] == self._self_addr else dict(entry) for entry in snapshot]
+
+	def _cached_cluster_snapshot(self):
+		"""
+		Returns the latest cluster snapshot, starting the snapshot thread on first use so nodes
+		whose cluster view nobody asks for do not poll the cluster.
+
+		Returns:
+			list or None: The snapshot, or None if none has been taken yet.
+		"""
+		self._start_thread('_snapshot_thread', self._refresh_cluster_snapshot_loop, stop_attr='_stop_snapshot_thread')
+		with self._cluster_snapshot_lock:
+			return self._cluster_snapshot
+
+	def _refresh_cluster_snapshot_loop(self):
+		"""
+		Snapshot thread. Refreshes the cluster snapshot every monitor interval until shutdown.
+		"""
+		self.logger.info("Snapshot thread started")
+		stop_event = self._stop_snapshot_thread
+		while not stop_event.wait(self.monitor_interval):
 			try:
-				response = requests.get(f'http://{ip}/status', timeout=2)
-				data = response.json()
-				res.append({'name': data.get('name', 'Server'), 'ip': ip, 'status': data['status']})
-				seen_ips.add(ip)
-			except Exception:
-				self.logger.warning(f"Failed to get status from {ip}")
-				res.append({'name': 'Server', 'ip': ip, 'status': 'crashed'})
-				seen_ips.add(ip)
-		# If self_addr is not in ip_list, append it at the end
-		if self.config['self_addr'] not in seen_ips:
-			res = [{'name': self.config.get('name', 'Server'), 'ip': self.config['self_addr'], 'status': self.status}] + res
+				self._refresh_cluster_snapshot()
+			except Exception as e:
+				self.logger.error('Error refreshing cluster snapshot: %s', e)
+
+	def _refresh_cluster_snapshot(self):
+		"""
+		Polls all nodes for their status and stores the result as the cluster snapshot.
+
+		Returns:
+			list: List of dicts with name, ip, and status for each node.
+		"""
+		self.logger.debug("Refreshing cluster snapshot")
+		cluster, peers = self._cluster, self._cluster_peers
+		# Take what the parent already knows about the cluster, then poll the rest concurrently
+		remote = self._fetch_parent_snapshot() if self.config['role'] != 'master' else {}
+		peer_statuses = {ip: {'name': remote[ip].get('name', 'Server'), 'ip': ip, 'status': remote[ip]['status']} for ip in peers if ip in remote}
+		missing = [ip for ip in peers if ip not in peer_statuses]
+		peer_statuses.update(zip(missing, self._pool.map(self._get_node_status, missing)))
+
+		# Build statuses in cluster order
+		self_entry = {'name': self.config.get('name', 'Server'), 'ip': self._self_addr, 'status': self.status}
+		res = [self_entry if ip == self._self_addr else peer_statuses[ip] for ip in cluster]
+		# If self_addr is not part of the cluster list, put it first
+		if self._self_addr not in cluster:
+			res.insert(0, self_entry)
+		with self._cluster_snapshot_lock:
+			self._cluster_snapshot = res
 		return res
 
+	def _fetch_parent_snapshot(self):
+		"""
+		Fetches the parent's cached view of the cluster from its /peers_snapshot endpoint.
+
+		Returns:
+			dict: Mapping of IP to name and status, or an empty dict if unavailable.
+		"""
+		try:
+			resp = self._session.get(self._url(self._parent_addr, 'peers_snapshot'), timeout=HTTP_TIMEOUT)
+			resp.raise_for_status()
+			return {ip: entry for ip, entry in _loads(resp.content).items() if ip != self._self_addr and 'status' in entry}
+		except Exception:
+			self.logger.debug("Failed to fetch peers snapshot from %s", self._parent_addr)
+			return {}
+
+	def _get_node_status(self, ip):
+		"""
+		Gets the status entry of a single node for get_all_statuses.
+
+		Args:
+			ip (str): The IP address to query.
+
+		Returns:
+			dict: Dict with name, ip, and status ('crashed' if unreachable).
+		"""
+		try:
+			data = self._fetch_status(ip)
+			return {'name': data.get('name', 'Server'), 'ip': ip, 'status': data['status']}
+		except Exception:
+			self.logger.debug("Failed to get status from %s", ip)
+			return {'name': 'Server', 'ip': ip, 'status': 'crashed'}
+
 	def stop_main_code(self, action):
 		"""
 		Stops the main code and sets status to 'waiting' unless a custom status is set.
@@ -461,19 +993,45 @@ class Lighthouse:
 		"""
 		self.logger.info('Stopping main code...')
 		self.status = 'waiting' if not self.custom_status else self.status
-		if self.stop_code_callback:
-			if self.stop_code_callback.__code__.co_argcount > 0:
-				self.stop_code_callback(action)
-			else:
-				self.stop_code_callback()
+		if self._stop_cb:
+			self._stop_cb(action)
 
-	def run(self, app=None):
+	def shutdown(self):
+		"""
+		Stops the monitor and snapshot threads, including during a failover wait, and cancels a pending
+		temporary status. The main code is left as is; call initialize() to start monitoring again.
+		"""
+		self.logger.info("Shutting down Lighthouse node")
+		self.stop_monitor_thread.set()
+		self._stop_snapshot_thread.set()
+		if self._timeout_timer is not None:
+			self._timeout_timer.cancel()
+
+	def run(self, app=None, server_type='waitress', threads=SERVER_THREADS):
 		"""
 		Runs the Flask app and starts the Lighthouse node.
 
 		Args:
 			app (Flask, optional): An existing Flask app instance. If None, a new one is created.
+			server_type (str, optional): WSGI server to use, 'waitress' or 'gevent'. Defaults to 'waitress'.
+				The 'gevent' server requires `gevent.monkey.patch_all()` to be called at the top of your entrypoint.
+			threads (int, optional): Number of waitress worker threads; at most half of them serve long polls. Defaults to 4.
+
+		Raises:
+			ValueError: If server_type is unknown.
+			RuntimeError: If server_type is 'gevent' and threading is not monkey-patched.
 		"""
+		if server_type not in ('waitress', 'gevent'):
+			raise ValueError(f"Unknown server_type '{server_type}'")
+		if server_type == 'gevent':
+			from gevent import monkey
+			# An unpatched Condition.wait in /wait_for_change would block the whole gevent hub
+			if not monkey.is_module_patched('threading'):
+				raise RuntimeError("server_type='gevent' requires gevent.monkey.patch_all() at the top of your entrypoint")
+			# Waiting greenlets do not tie up worker threads
+			self._long_poll_slots = None
+		else:
+			self._long_poll_slots = self._build_long_poll_slots(threads)
 		self.logger.info("Running Lighthouse Flask app")
 		self.app = app
 		if self.app is None:
@@ -481,8 +1039,19 @@ class Lighthouse:
 		self.register_routes()
 		if not self.pass_flask_app:
 			threading.Thread(target=self.initialize, daemon=True).start()
-			host, port = self.config['self_addr'].split(':')
-			serve(self.app, host='0.0.0.0', port=int(port))
+			port = int(self._port)
+			if server_type == 'gevent':
+				from gevent.pywsgi import WSGIServer
+
+				class NoDelayWSGIServer(WSGIServer):
+					# waitress and urllib3 disable Nagle's algorithm by default, gevent does not
+					def handle(self, sock, address):
+						sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+						super().handle(sock, address)
+
+				NoDelayWSGIServer(('0.0.0.0', port), self.app).serve_forever()
+			else:
+				serve(self.app, host='0.0.0.0', port=port, threads=threads)
 		else:
 			self.initialize()
 			Event().wait()
\ No newline at end of file